@@ -0,0 +1,30 @@
+"""Per-interface IPv4 lookup via the SIOCGIFADDR ioctl (Linux only).
+
+Cheaper than psutil.net_if_addrs() when only one interface is needed:
+one ioctl on a throwaway UDP socket instead of enumerating every
+interface and address family on the system.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import socket
+import struct
+
+SIOCGIFADDR = 0x8915
+
+# struct ifreq: 16-byte name, then the sockaddr union
+_IFNAMSIZ = 16
+
+
+def get_ipv4(ifname: str) -> str | None:
+    """Return the interface's IPv4 address, or None."""
+    req = struct.pack("256s", ifname.encode()[: _IFNAMSIZ - 1])
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            res = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, req)
+    except OSError:
+        # No such interface, or no address assigned
+        return None
+    # sockaddr_in: family (2), port (2), then the 4-byte address
+    return socket.inet_ntoa(res[_IFNAMSIZ + 4:_IFNAMSIZ + 8])
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from PIL import Image, ImageDraw, ImageFont
 
 # Display dimensions (landscape)
@@ -13,6 +15,16 @@ INK = 0  # black pixel (ink applied)
 NO_INK = 255  # white pixel (no ink)
 
 
+@functools.lru_cache(maxsize=512)
+def _measure(font: ImageFont.FreeTypeFont, text: str) -> int:
+    """Return pixel width of text, cached per (font, text).
+
+    Fonts are module-level singletons, so keying on the font object
+    itself is safe and keeps it alive for as long as it is cached.
+    """
+    return int(font.getlength(text))
+
+
 class Composer:
     """Manage two 1-bit image buffers: one for black, one for red.
 
@@ -28,6 +40,11 @@ class Composer:
         self._draw_black = ImageDraw.Draw(self._black)
         self._draw_red = ImageDraw.Draw(self._red)
 
+    def reset(self) -> None:
+        """Clear both layers to no-ink so the buffers can be reused."""
+        self._black.paste(NO_INK, (0, 0, WIDTH, HEIGHT))
+        self._red.paste(NO_INK, (0, 0, WIDTH, HEIGHT))
+
     def _draw(self, color: str) -> ImageDraw.ImageDraw:
         if color == "red":
             return self._draw_red
@@ -58,10 +75,8 @@ class Composer:
         color: str = "black",
     ) -> None:
         """Draw horizontally centered text."""
-        draw = self._draw(color)
-        tw = draw.textlength(text, font=font)
-        x = (WIDTH - int(tw)) // 2
-        draw.text((x, y), text, fill=INK, font=font)
+        x = (WIDTH - _measure(font, text)) // 2
+        self._draw(color).text((x, y), text, fill=INK, font=font)
 
     def text_right(
         self,
@@ -72,14 +87,12 @@ class Composer:
         margin: int = 4,
     ) -> None:
         """Draw right-aligned text."""
-        draw = self._draw(color)
-        tw = draw.textlength(text, font=font)
-        x = WIDTH - int(tw) - margin
-        draw.text((x, y), text, fill=INK, font=font)
+        x = WIDTH - _measure(font, text) - margin
+        self._draw(color).text((x, y), text, fill=INK, font=font)
 
     def textlength(self, text: str, font: ImageFont.FreeTypeFont) -> int:
-        """Return pixel width of text (layer-independent)."""
-        return int(self._draw_black.textlength(text, font=font))
+        """Return pixel width of text (layer-independent, cached)."""
+        return _measure(font, text)
 
     def rect(
         self,
@@ -121,6 +134,27 @@ class Composer:
         else:
             self._draw(color).ellipse([(x0, y0), (x1, y1)], outline=INK)
 
+    def polygon(
+        self,
+        points: list[tuple[int, int]],
+        color: str = "black",
+        fill: bool = True,
+    ) -> None:
+        """Draw a filled or outlined polygon."""
+        if fill:
+            self._draw(color).polygon(points, fill=INK, outline=INK)
+        else:
+            self._draw(color).polygon(points, outline=INK)
+
+    def paste_mask(
+        self,
+        mask: Image.Image,
+        xy: tuple[int, int] = (0, 0),
+        color: str = "black",
+    ) -> None:
+        """Apply ink wherever a pre-rendered mask is non-zero."""
+        self._draw(color).bitmap(xy, mask, fill=INK)
+
     def progress_bar(
         self,
         x: int,
@@ -159,7 +193,7 @@ class Composer:
     ) -> None:
         """Draw a label: value pair with label in one color and value in another."""
         self.text((x, y), label, font=label_font, color=label_color)
-        lw = self.textlength(label, label_font)
+        lw = _measure(label_font, label)
         self.text((x + lw + gap, y), value, font=value_font, color=value_color)
 
     def paste_image(
@@ -11,6 +11,9 @@ log = logging.getLogger("pi-eink-dashboard")
 WIDTH = 264
 HEIGHT = 176
 
+# Packed EPD buffers kept for recently shown layers (keyed by raw bytes)
+PACKED_CACHE_SIZE = 16
+
 
 class DisplayNotFoundError(Exception):
     """Raised when the e-Paper HAT hardware is not detected."""
@@ -36,23 +39,49 @@ class Display:
         self._epd.Clear()
         log.info("EPD initialized and cleared.")
 
-    def show(self, black_image: Image.Image, red_image: Image.Image) -> None:
+        self._last_frame: tuple[bytes, bytes] | None = None
+        self._packed: dict[bytes, bytes] = {}
+
+    def _pack(self, image: Image.Image, key: bytes) -> bytes:
+        """Rotate and pack a layer, reusing the buffer if seen recently."""
+        buf = self._packed.get(key)
+        if buf is None:
+            # EPD native resolution is 176x264 (portrait). Composer draws
+            # 264x176 (landscape); getbuffer() rotates it 90 CCW with
+            # np.rot90 while packing, so no PIL transpose is needed.
+            buf = self._epd.getbuffer(image)
+            if len(self._packed) >= PACKED_CACHE_SIZE:
+                self._packed.pop(next(iter(self._packed)))
+            self._packed[key] = buf
+        return buf
+
+    def show(
+        self,
+        black_image: Image.Image,
+        red_image: Image.Image,
+        force: bool = False,
+    ) -> None:
         """Display two 1-bit PIL Images (black layer and red layer).
 
         Images should be 264x176 mode '1'. White=255 (no ink), Black=0 (ink).
         Rotates from landscape (264x176) to portrait (176x264) for the EPD.
+        Skips the panel refresh entirely if the frame is unchanged, unless
+        force is set (a user-requested redraw, e.g. to clear ghosting).
         """
-        # EPD native resolution is 176x264 (portrait). Composer draws 264x176
-        # (landscape). Rotate 90 CCW to match.
-        black_rot = black_image.transpose(Image.ROTATE_90)
-        red_rot = red_image.transpose(Image.ROTATE_90)
-        black_buf = self._epd.getbuffer(black_rot)
-        red_buf = self._epd.getbuffer(red_rot)
+        frame = (black_image.tobytes(), red_image.tobytes())
+        if not force and frame == self._last_frame:
+            log.info("Frame unchanged — skipping refresh.")
+            return
+
+        black_buf = self._pack(black_image, frame[0])
+        red_buf = self._pack(red_image, frame[1])
         self._epd.display(black_buf, red_buf)
+        self._last_frame = frame
 
     def clear(self) -> None:
         """Clear the display to white."""
         self._epd.Clear()
+        self._last_frame = None
 
     def close(self) -> None:
         """Clear display and enter sleep mode."""
@@ -10,7 +10,12 @@ import logging
 from pathlib import Path
 
 import numpy as np
-from PIL import Image, ImageEnhance
+from PIL import Image
+
+try:
+    from numba import njit
+except ImportError:  # optional — fall back to the plain Python loop
+    njit = None
 
 log = logging.getLogger("pi-eink-dashboard")
 
@@ -32,53 +37,172 @@ _IDX_WHITE = 2
 # Floyd-Steinberg error diffusion weights:
 #       * 7/16
 # 3/16 5/16 1/16
-_FS_KERNEL = [(1, 0, 7 / 16), (-1, 1, 3 / 16), (0, 1, 5 / 16), (1, 1, 1 / 16)]
+_FS_KERNEL = ((1, 0, 7 / 16), (-1, 1, 3 / 16), (0, 1, 5 / 16), (1, 1, 1 / 16))
+
+
+# --- sRGB → CIELAB pipeline (gamma-correct, float32 throughout) ---
 
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+], dtype=np.float32)
+
+_D65_WHITE = np.array([0.95047, 1.00000, 1.08883], dtype=np.float32)
+
+# ITU-R 601-2 luma, as used by PIL's "L" conversion
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
 
-# --- sRGB → CIELAB pipeline (gamma-correct) ---
 
 def _srgb_to_linear(srgb: np.ndarray) -> np.ndarray:
     """Convert sRGB [0,255] to linear RGB [0,1]."""
-    v = srgb / 255.0
-    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+    v = srgb.astype(np.float32) * np.float32(1.0 / 255.0)
+    return np.where(
+        v <= np.float32(0.04045),
+        v / np.float32(12.92),
+        ((v + np.float32(0.055)) / np.float32(1.055)) ** np.float32(2.4),
+    )
 
 
 def _linear_to_xyz(rgb: np.ndarray) -> np.ndarray:
     """Convert linear RGB to CIE XYZ (D65 illuminant)."""
-    m = np.array([
-        [0.4124564, 0.3575761, 0.1804375],
-        [0.2126729, 0.7151522, 0.0721750],
-        [0.0193339, 0.1191920, 0.9503041],
-    ])
-    return rgb @ m.T
+    return rgb @ _RGB_TO_XYZ.T
 
 
 def _xyz_to_lab(xyz: np.ndarray) -> np.ndarray:
     """Convert CIE XYZ to CIELAB."""
-    white = np.array([0.95047, 1.00000, 1.08883])
-    xyz_n = xyz / white
+    xyz_n = xyz / _D65_WHITE
 
-    delta = 6.0 / 29.0
+    delta = np.float32(6.0 / 29.0)
     f = np.where(
         xyz_n > delta ** 3,
         np.cbrt(xyz_n),
-        xyz_n / (3 * delta ** 2) + 4.0 / 29.0,
+        xyz_n / (3 * delta ** 2) + np.float32(4.0 / 29.0),
     )
 
-    L = 116.0 * f[..., 1] - 16.0
-    a = 500.0 * (f[..., 0] - f[..., 1])
-    b = 200.0 * (f[..., 1] - f[..., 2])
+    L = np.float32(116.0) * f[..., 1] - np.float32(16.0)
+    a = np.float32(500.0) * (f[..., 0] - f[..., 1])
+    b = np.float32(200.0) * (f[..., 1] - f[..., 2])
     return np.stack([L, a, b], axis=-1)
 
 
 def _srgb_to_lab(srgb: np.ndarray) -> np.ndarray:
-    """Convert sRGB [0,255] to CIELAB."""
+    """Convert sRGB [0,255] to CIELAB (float32)."""
     return _xyz_to_lab(_linear_to_xyz(_srgb_to_linear(srgb)))
 
 
 # Pre-compute palette in CIELAB (module-level, done once)
 _PALETTE_LAB = _srgb_to_lab(PALETTE_SRGB)
 
+# sRGB -> CIELAB lookup table on a 5-bit-per-channel grid (32^3 entries,
+# ~390 kB), indexed by (r >> 3, g >> 3, b >> 3). Grid levels use bit
+# replication (i << 3 | i >> 2) so 0 and 255 map exactly. 5-bit input
+# precision is far finer than the 3-color output can resolve.
+# Gamma is per-channel, so it is evaluated on the 32 levels before the
+# grid is expanded; only the XYZ/LAB steps run over all entries.
+_LUT_LEVELS = np.arange(32)
+_LUT_LEVELS = _srgb_to_linear((_LUT_LEVELS << 3) | (_LUT_LEVELS >> 2))
+_LAB_LUT = _xyz_to_lab(_linear_to_xyz(
+    np.stack(np.meshgrid(_LUT_LEVELS, _LUT_LEVELS, _LUT_LEVELS, indexing="ij"), axis=-1)
+))
+
+
+def _enhance(rgb: np.ndarray, saturation: float, contrast: float) -> np.ndarray:
+    """Boost saturation then contrast, like PIL's ImageEnhance Color/Contrast.
+
+    Works in place on one float32 buffer instead of allocating an image
+    per enhancement. Return HxWx3 float32 in [0, 255].
+    """
+    arr = rgb.astype(np.float32)
+
+    # Color: blend away from the per-pixel grayscale
+    gray = (arr @ _LUMA)[..., None]
+    arr -= gray
+    arr *= saturation
+    arr += gray
+    np.clip(arr, 0, 255, out=arr)
+
+    # Contrast: blend away from the mean grayscale level
+    mean = float((arr @ _LUMA).mean())
+    arr -= mean
+    arr *= contrast
+    arr += mean
+    np.clip(arr, 0, 255, out=arr)
+    return arr
+
+
+def _fs_serpentine(pixels: np.ndarray, palette: np.ndarray) -> np.ndarray:
+    """Floyd-Steinberg with serpentine scanning over a LAB float32 buffer.
+
+    Quantization error accumulates into ``pixels`` in place. Return an
+    HxW uint8 array of palette indices. The 3-entry argmin is unrolled
+    into scalar comparisons so the loop compiles to plain native code
+    under Numba; without Numba it runs as ordinary Python.
+    """
+    height, width = pixels.shape[0], pixels.shape[1]
+    result = np.empty((height, width), dtype=np.uint8)
+
+    # Hoist the palette into plain float scalars so the loop never indexes it
+    pL0, pa0, pb0 = float(palette[0, 0]), float(palette[0, 1]), float(palette[0, 2])
+    pL1, pa1, pb1 = float(palette[1, 0]), float(palette[1, 1]), float(palette[1, 2])
+    pL2, pa2, pb2 = float(palette[2, 0]), float(palette[2, 1]), float(palette[2, 2])
+
+    for y in range(height):
+        if y % 2 == 0:
+            x_start, x_stop, direction = 0, width, 1
+        else:
+            x_start, x_stop, direction = width - 1, -1, -1
+
+        for x in range(x_start, x_stop, direction):
+            L = float(pixels[y, x, 0])
+            a = float(pixels[y, x, 1])
+            b = float(pixels[y, x, 2])
+
+            # Nearest palette color in CIELAB (Euclidean distance)
+            dL0, da0, db0 = L - pL0, a - pa0, b - pb0
+            dL1, da1, db1 = L - pL1, a - pa1, b - pb1
+            dL2, da2, db2 = L - pL2, a - pa2, b - pb2
+            d0 = dL0 * dL0 + da0 * da0 + db0 * db0
+            d1 = dL1 * dL1 + da1 * da1 + db1 * db1
+            d2 = dL2 * dL2 + da2 * da2 + db2 * db2
+            if d0 <= d1 and d0 <= d2:
+                nearest = 0
+                eL, ea, eb = dL0, da0, db0
+            elif d1 <= d2:
+                nearest = 1
+                eL, ea, eb = dL1, da1, db1
+            else:
+                nearest = 2
+                eL, ea, eb = dL2, da2, db2
+            result[y, x] = nearest
+
+            # Distribute quantization error to neighbors
+            for dx, dy, weight in _FS_KERNEL:
+                nx = x + dx * direction
+                ny = y + dy
+                if 0 <= nx < width and ny < height:
+                    pixels[ny, nx, 0] += eL * weight
+                    pixels[ny, nx, 1] += ea * weight
+                    pixels[ny, nx, 2] += eb * weight
+
+    return result
+
+
+if njit is not None:
+    _fs_serpentine = njit(cache=True, boundscheck=False, fastmath=True)(_fs_serpentine)
+
+
+def _pack_layer(no_ink: np.ndarray) -> Image.Image:
+    """Pack an HxW boolean no-ink mask straight into a mode '1' image.
+
+    Mode '1' raw data is 1 bit per pixel, MSB first, 1 = white, so
+    np.packbits produces it directly without an 'L' -> '1' conversion.
+    """
+    bits = np.packbits(no_ink, axis=1)
+    return Image.frombuffer(
+        "1", (no_ink.shape[1], no_ink.shape[0]), bits.tobytes(), "raw", "1", 0, 1
+    )
+
 
 def dither_image(
     source: str | Path | Image.Image,
@@ -100,49 +224,19 @@ def dither_image(
         img = Image.open(source).convert("RGB")
 
     img = img.resize((WIDTH, HEIGHT), Image.LANCZOS)
-    img = ImageEnhance.Color(img).enhance(saturation_boost)
-    img = ImageEnhance.Contrast(img).enhance(contrast_boost)
-
-    # Convert entire image sRGB → CIELAB (vectorized, fast)
-    pixels = _srgb_to_lab(np.array(img, dtype=np.float64))
-
-    result = np.zeros((HEIGHT, WIDTH), dtype=np.uint8)
-
-    # Floyd-Steinberg with serpentine scanning
-    for y in range(HEIGHT):
-        if y % 2 == 0:
-            x_range = range(WIDTH)
-            direction = 1
-        else:
-            x_range = range(WIDTH - 1, -1, -1)
-            direction = -1
-
-        for x in x_range:
-            old = pixels[y, x]
-
-            # Nearest palette color in CIELAB (Euclidean distance)
-            diff = _PALETTE_LAB - old
-            nearest = int(np.argmin(np.sum(diff * diff, axis=1)))
-            result[y, x] = nearest
+    rgb = _enhance(np.asarray(img), saturation_boost, contrast_boost)
 
-            # Distribute quantization error to neighbors
-            error = old - _PALETTE_LAB[nearest]
-            for dx, dy, weight in _FS_KERNEL:
-                nx = x + dx * direction
-                ny = y + dy
-                if 0 <= nx < WIDTH and 0 <= ny < HEIGHT:
-                    pixels[ny, nx] += error * weight
+    # Convert entire image sRGB → CIELAB via the 32^3 LUT (a single gather).
+    # The fancy-indexed result is a fresh float32 working buffer;
+    # quantization error accumulates into it in place.
+    rgb = rgb.astype(np.uint8) >> 3
+    pixels = _LAB_LUT[rgb[..., 0], rgb[..., 1], rgb[..., 2]]
 
-    # Extract layers: 0=ink, 255=no ink
-    black_data = np.where(result == _IDX_BLACK, 0, 255).astype(np.uint8)
-    red_data = np.where(result == _IDX_RED, 0, 255).astype(np.uint8)
+    result = _fs_serpentine(pixels, _PALETTE_LAB)
 
-    black_layer = Image.fromarray(black_data, mode="L").convert(
-        "1", dither=Image.Dither.NONE
-    )
-    red_layer = Image.fromarray(red_data, mode="L").convert(
-        "1", dither=Image.Dither.NONE
-    )
+    # Extract layers: 0=ink, 1=no ink
+    black_layer = _pack_layer(result != _IDX_BLACK)
+    red_layer = _pack_layer(result != _IDX_RED)
 
     label = source if isinstance(source, (str, Path)) else "PIL.Image"
     log.info("Dithered %s to %dx%d tri-color (CIELAB+serpentine).", label, WIDTH, HEIGHT)
@@ -8,6 +8,9 @@ Data commands: 0x10 (black), 0x13 (red) (different from V2's 0x24/0x26).
 """
 
 import logging
+
+import numpy as np
+
 from . import epdconfig
 
 # Display resolution
@@ -41,6 +44,9 @@ logger = logging.getLogger(__name__)
 
 
 class EPD:
+    # All-white frame (V1 polarity: bit=0 means no ink), shared by Clear()
+    _CLEAR_BUF = bytes(EPD_WIDTH * EPD_HEIGHT // 8)
+
     def __init__(self):
         self.reset_pin = epdconfig.RST_PIN
         self.dc_pin = epdconfig.DC_PIN
@@ -299,13 +305,8 @@ class EPD:
     def wait_until_idle(self, timeout_ms=30000):
         """Wait until BUSY pin goes HIGH (idle). V1: 0=busy, 1=idle."""
         logger.debug("e-Paper busy")
-        elapsed = 0
-        while epdconfig.digital_read(self.busy_pin) == 0:
-            epdconfig.delay_ms(100)
-            elapsed += 100
-            if elapsed >= timeout_ms:
-                logger.warning("e-Paper busy timeout after %d ms", timeout_ms)
-                break
+        if not epdconfig.wait_busy_idle(timeout_ms):
+            logger.warning("e-Paper busy timeout after %d ms", timeout_ms)
         logger.debug("e-Paper busy release")
 
     def set_lut(self):
@@ -391,31 +392,28 @@ class EPD:
         return 0
 
     def getbuffer(self, image):
-        """Convert a 1-bit PIL image to the EPD buffer format."""
-        buf = [0xFF] * (self.width * self.height // 8)
-        image_monocolor = image.convert("1")
-        imwidth, imheight = image_monocolor.size
-        pixels = image_monocolor.load()
+        """Convert a 1-bit PIL image to the EPD buffer format.
+
+        V1 polarity: bit=1 means ink (pixel value 0), packed MSB first.
+        Landscape images (264x176) are rotated 90 CCW into the native
+        portrait frame.
+        """
+        pixels = np.asarray(image.convert("1"), dtype=np.uint8)
+        imheight, imwidth = pixels.shape
 
         if imwidth == self.width and imheight == self.height:
-            for y in range(imheight):
-                for x in range(imwidth):
-                    if pixels[x, y] != 0:
-                        buf[(x + y * self.width) // 8] &= ~(0x80 >> (x % 8))
+            ink = pixels == 0
         elif imwidth == self.height and imheight == self.width:
-            for y in range(imheight):
-                for x in range(imwidth):
-                    newx = y
-                    newy = self.height - x - 1
-                    if pixels[x, y] != 0:
-                        buf[(newx + newy * self.width) // 8] &= ~(0x80 >> (y % 8))
-        return buf
+            ink = np.rot90(pixels) == 0
+        else:
+            return bytes([0xFF]) * (self.width * self.height // 8)
+        return np.packbits(ink, axis=1).tobytes()
 
     def display(self, imageblack, imagered):
         """Send black and red image buffers to the display and refresh.
 
         V1 protocol: command 0x10 for black, 0x13 for red.
-        Sends data byte-by-byte matching original Waveshare driver.
+        Each buffer is sent as one bulk SPI write with DC held high.
         """
         self.send_command(TCON_RESOLUTION)
         self.send_data(EPD_WIDTH >> 8)
@@ -426,15 +424,13 @@ class EPD:
         if imageblack is not None:
             self.send_command(DATA_START_TRANSMISSION_1)
             epdconfig.delay_ms(2)
-            for i in range(0, self.width * self.height // 8):
-                self.send_data(imageblack[i])
+            self.send_data2(imageblack)
             self.send_command(DATA_STOP)
 
         if imagered is not None:
             self.send_command(DATA_START_TRANSMISSION_2)
             epdconfig.delay_ms(2)
-            for i in range(0, self.width * self.height // 8):
-                self.send_data(imagered[i])
+            self.send_data2(imagered)
             self.send_command(DATA_STOP)
 
         self.send_command(DISPLAY_REFRESH)
@@ -442,8 +438,6 @@ class EPD:
 
     def Clear(self):
         """Clear the display to white."""
-        buf_size = self.width * self.height // 8
-
         self.send_command(TCON_RESOLUTION)
         self.send_data(EPD_WIDTH >> 8)
         self.send_data(EPD_WIDTH & 0xFF)
@@ -453,14 +447,12 @@ class EPD:
         # V1 polarity: bit=1 means ink, bit=0 means no ink (white)
         self.send_command(DATA_START_TRANSMISSION_1)
         epdconfig.delay_ms(2)
-        for i in range(buf_size):
-            self.send_data(0x00)
+        self.send_data2(self._CLEAR_BUF)
         self.send_command(DATA_STOP)
 
         self.send_command(DATA_START_TRANSMISSION_2)
         epdconfig.delay_ms(2)
-        for i in range(buf_size):
-            self.send_data(0x00)
+        self.send_data2(self._CLEAR_BUF)
         self.send_command(DATA_STOP)
 
         self.send_command(DISPLAY_REFRESH)
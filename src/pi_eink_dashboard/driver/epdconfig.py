@@ -15,8 +15,21 @@ DC_PIN = 25
 CS_PIN = 8
 BUSY_PIN = 24
 
+# SPI clock: 8 MHz keeps some margin below the ~10 MHz the panel tolerates
+SPI_SPEED_HZ = 8000000
+
+# Upper bound on a single BUSY edge wait, so an edge that lands between
+# the level check and arming the wait costs at most this much latency
+BUSY_EDGE_SLICE_MS = 1000
+BUSY_POLL_MS = 100
+
+# spidev rejects transfers larger than its bufsiz module parameter
+SPIDEV_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+SPIDEV_DEFAULT_BUFSIZ = 4096
+
 # Lazily initialized
 SPI = None
+SPI_BUFSIZ = SPIDEV_DEFAULT_BUFSIZ
 
 
 def digital_write(pin, value):
@@ -31,16 +44,45 @@ def delay_ms(delaytime):
     time.sleep(delaytime / 1000.0)
 
 
+def wait_busy_idle(timeout_ms):
+    """Block until BUSY reads 1 (idle); return False on timeout.
+
+    Sleeps in the kernel on a rising edge instead of polling. Falls back
+    to polling if edge detection is unavailable (e.g. no sysfs GPIO).
+    """
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    while GPIO.input(BUSY_PIN) == 0:
+        remaining = int((deadline - time.monotonic()) * 1000)
+        if remaining <= 0:
+            return False
+        try:
+            GPIO.wait_for_edge(
+                BUSY_PIN, GPIO.RISING, timeout=min(remaining, BUSY_EDGE_SLICE_MS)
+            )
+        except RuntimeError:
+            delay_ms(min(remaining, BUSY_POLL_MS))
+    return True
+
+
 def spi_transfer(data):
     SPI.writebytes(data)
 
 
 def spi_writebyte2(data):
-    SPI.writebytes2(data)
+    for i in range(0, len(data), SPI_BUFSIZ):
+        SPI.writebytes2(data[i:i + SPI_BUFSIZ])
+
+
+def _read_spidev_bufsiz():
+    try:
+        with open(SPIDEV_BUFSIZ_PATH) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return SPIDEV_DEFAULT_BUFSIZ
 
 
 def module_init():
-    global SPI
+    global SPI, SPI_BUFSIZ
 
     GPIO.setmode(GPIO.BCM)
     GPIO.setwarnings(False)
@@ -50,8 +92,9 @@ def module_init():
     GPIO.setup(BUSY_PIN, GPIO.IN)
 
     SPI = spidev.SpiDev(0, 0)
-    SPI.max_speed_hz = 2000000
+    SPI.max_speed_hz = SPI_SPEED_HZ
     SPI.mode = 0b00
+    SPI_BUFSIZ = _read_spidev_bufsiz()
     return 0
 
 
@@ -1,6 +1,8 @@
 """4-button input handler for Waveshare 2.7" e-Paper HAT (B) V1."""
 
+import functools
 import logging
+import queue
 import time
 
 log = logging.getLogger("pi-eink-dashboard")
@@ -17,33 +19,67 @@ DEBOUNCE_MS = 200
 
 
 class InputHandler:
-    """Read button events with debouncing via gpiozero."""
+    """Receive button events with debouncing via gpiozero callbacks.
+
+    Presses are pushed onto a queue from gpiozero's event thread, so
+    waiting for input blocks instead of polling pin state.
+    """
 
     def __init__(self) -> None:
         self._buttons: dict[str, object] = {}
         self._last_event_time: dict[str, float] = {}
+        self._events: queue.SimpleQueue[tuple[float, str]] = queue.SimpleQueue()
         self._available = False
 
         try:
             import gpiozero
 
             for name, pin in PINS.items():
-                self._buttons[name] = gpiozero.Button(pin, pull_up=True)
+                button = gpiozero.Button(pin, pull_up=True)
+                button.when_pressed = functools.partial(self._on_press, name)
+                self._buttons[name] = button
                 self._last_event_time[name] = 0.0
             self._available = True
             log.info("Buttons initialized: %s", list(PINS.keys()))
         except Exception as e:
             log.warning("Button input unavailable: %s", e)
 
-    def poll(self) -> str | None:
-        """Return the name of a pressed button, or None."""
+    def _on_press(self, name: str) -> None:
+        self._events.put((time.monotonic(), name))
+
+    def _accept(self, stamp: float, name: str) -> bool:
+        """Apply debouncing to a queued press."""
+        if (stamp - self._last_event_time[name]) > (DEBOUNCE_MS / 1000):
+            self._last_event_time[name] = stamp
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Drop presses queued while the display was busy.
+
+        A refresh takes seconds; presses made during it are stale and
+        would otherwise replay as extra refreshes.
+        """
+        while True:
+            try:
+                self._events.get_nowait()
+            except queue.Empty:
+                return
+
+    def wait(self, timeout: float) -> str | None:
+        """Block up to timeout seconds for a button press; return it or None."""
         if not self._available:
+            time.sleep(timeout)
             return None
 
-        now = time.monotonic()
-        for name, button in self._buttons.items():
-            if button.is_pressed:  # type: ignore[union-attr]
-                if (now - self._last_event_time[name]) > (DEBOUNCE_MS / 1000):
-                    self._last_event_time[name] = now
-                    return name
-        return None
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                stamp, name = self._events.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if self._accept(stamp, name):
+                return name
@@ -1,16 +1,40 @@
 """Entry point: render/poll loop for e-paper dashboard."""
 
+from __future__ import annotations
+
+import importlib
 import logging
 import signal
 import sys
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .screens.base import BaseScreen
 
 log = logging.getLogger("pi-eink-dashboard")
 
-POLL_SLEEP = 0.2  # seconds between button polls
+POLL_SLEEP = 1.0  # max seconds to block waiting for a button (bounds shutdown latency)
 REFRESH_INTERVAL = 180.0  # seconds between auto-refreshes (3 min)
 DEMO_SAVE_DIR = "demo_output"
 
+# Screen rotation order as "module:Class" under .screens, imported on first use
+SCREENS = [
+    "dashboard:DashboardScreen",
+    "identity:IdentityScreen",
+    "network:NetworkScreen",
+    "health:HealthScreen",
+    "test_pattern:TestPatternScreen",
+    "art:ArtScreen",
+]
+
+
+def _load_screen(spec: str) -> BaseScreen:
+    """Import and instantiate a screen from its "module:Class" spec."""
+    module_name, cls_name = spec.split(":")
+    module = importlib.import_module(f".screens.{module_name}", __package__)
+    return getattr(module, cls_name)()
+
 
 def main() -> None:
     logging.basicConfig(
@@ -48,27 +72,23 @@ def main() -> None:
         print("pi-eink-dashboard: EPD ready.", flush=True)
 
     from .input import InputHandler
-    from .screens.art import ArtScreen
-    from .screens.dashboard import DashboardScreen
-    from .screens.health import HealthScreen
-    from .screens.identity import IdentityScreen
-    from .screens.network import NetworkScreen
-    from .screens.test_pattern import TestPatternScreen
 
     inp = InputHandler()
-    screens = [
-        DashboardScreen(),
-        IdentityScreen(),
-        NetworkScreen(),
-        HealthScreen(),
-        TestPatternScreen(),
-        ArtScreen(),
-    ]
-    total = len(screens)
+    screens: dict[int, BaseScreen] = {}
+    total = len(SCREENS)
+
+    def get_screen(idx: int) -> BaseScreen:
+        """Return the screen at idx, importing its module on first use."""
+        if idx not in screens:
+            screens[idx] = _load_screen(SCREENS[idx])
+        return screens[idx]
 
     photo_cache = PhotoCache()
     photo_screen = PhotoScreen(photo_cache)
 
+    # One composer for the whole process; reset() before each render
+    composer = Composer()
+
     screen_idx = 0
     saved_screen_idx = 0
     slideshow_mode = False
@@ -81,16 +101,19 @@ def main() -> None:
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    def render_current() -> None:
-        """Render current screen and send to display (or save PNG in demo mode)."""
-        composer = Composer()
+    def render_current(force: bool = False) -> None:
+        """Render current screen and send to display (or save PNG in demo mode).
+
+        force redraws the panel even if the frame is unchanged.
+        """
+        composer.reset()
 
         if slideshow_mode:
             screen = photo_screen
             title = "photo"
             label = f"photo {photo_cache.index + 1}/{photo_cache.count}"
         else:
-            screen = screens[screen_idx]
+            screen = get_screen(screen_idx)
             title = screen.title or "fullbleed"
             label = f"screen {screen_idx + 1}/{total}: {title}"
 
@@ -100,14 +123,14 @@ def main() -> None:
 
         if display is not None:
             print("pi-eink-dashboard: sending to EPD...", flush=True)
-            display.show(black_img, red_img)
+            display.show(black_img, red_img, force=force)
             print("pi-eink-dashboard: display updated.", flush=True)
         else:
             _save_demo(screen_idx, screen, title, black_img, red_img)
 
     def show_loading() -> None:
         """Render loading screen immediately to display (or save PNG in demo)."""
-        composer = Composer()
+        composer.reset()
         photo_screen.draw_loading(composer)
         black_img, red_img = composer.result()
 
@@ -123,7 +146,7 @@ def main() -> None:
         """Save rendered images as PNGs for headless development."""
         import os
 
-        from PIL import Image
+        from PIL import Image, ImageChops
 
         os.makedirs(DEMO_SAVE_DIR, exist_ok=True)
         name = title.lower().replace(" ", "_")
@@ -132,17 +155,18 @@ def main() -> None:
         black_img.save(f"{DEMO_SAVE_DIR}/{idx}_{name}_black.png")  # type: ignore[union-attr]
         red_img.save(f"{DEMO_SAVE_DIR}/{idx}_{name}_red.png")  # type: ignore[union-attr]
 
-        # Create composite preview: white bg, black ink as black, red ink as red
-        preview = Image.new("RGB", (264, 176), (255, 255, 255))
-        for py in range(176):
-            for px in range(264):
-                r_pixel = red_img.getpixel((px, py))  # type: ignore[union-attr]
-                b_pixel = black_img.getpixel((px, py))  # type: ignore[union-attr]
-                if r_pixel == 0:
-                    preview.putpixel((px, py), (200, 0, 0))
-                elif b_pixel == 0:
-                    preview.putpixel((px, py), (0, 0, 0))
-        preview.save(f"{DEMO_SAVE_DIR}/{idx}_{name}_preview.png")
+        # Create composite preview: white bg, black ink as black, red ink as red.
+        # Ink is 0, so a layer with no ink has extrema (255, 255) and an
+        # inverted layer is its paste mask. Red goes last: it overrides black.
+        blank = (
+            black_img.getextrema() == (255, 255)  # type: ignore[union-attr]
+            and red_img.getextrema() == (255, 255)  # type: ignore[union-attr]
+        )
+        preview_img = Image.new("RGB", (264, 176), (255, 255, 255))
+        if not blank:
+            preview_img.paste((0, 0, 0), mask=ImageChops.invert(black_img))  # type: ignore[arg-type]
+            preview_img.paste((200, 0, 0), mask=ImageChops.invert(red_img))  # type: ignore[arg-type]
+        preview_img.save(f"{DEMO_SAVE_DIR}/{idx}_{name}_preview.png")
         log.info("Saved demo: %s/%d_%s_preview.png", DEMO_SAVE_DIR, idx, name)
 
     try:
@@ -159,7 +183,7 @@ def main() -> None:
                 photo_cache.refresh()
                 if photo_cache.count > 0:
                     slideshow_mode = True
-                    composer = Composer()
+                    composer.reset()
                     photo_screen.render(0, 1, composer)
                     black_img, red_img = composer.result()
                     _save_demo(total, photo_screen, "photo", black_img, red_img)
@@ -173,11 +197,14 @@ def main() -> None:
             return
 
         # === MAIN LOOP ===
+        force_refresh = False
         while running:
             # --- RENDER PHASE ---
-            render_current()
+            render_current(force=force_refresh)
+            force_refresh = False
 
             # --- POLL PHASE ---
+            inp.clear()
             poll_start = time.monotonic()
             while running:
                 elapsed = time.monotonic() - poll_start
@@ -187,9 +214,8 @@ def main() -> None:
                         photo_screen.advance()
                     break
 
-                event = inp.poll()
+                event = inp.wait(min(POLL_SLEEP, REFRESH_INTERVAL - elapsed))
                 if event is None:
-                    time.sleep(POLL_SLEEP)
                     continue
 
                 if slideshow_mode:
@@ -202,6 +228,7 @@ def main() -> None:
                         break
                     elif event == "KEY3":
                         # Re-fetch photos: first one blocks, rest in background
+                        force_refresh = True
                         show_loading()
                         log.info("Slideshow: refreshing photos...")
                         try:
@@ -227,6 +254,7 @@ def main() -> None:
                         screen_idx = (screen_idx + 1) % total
                         break
                     elif event == "KEY3":
+                        force_refresh = True
                         break
                     elif event == "KEY4":
                         # Enter slideshow
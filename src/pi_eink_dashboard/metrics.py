@@ -0,0 +1,302 @@
+"""System metric probes shared by the screens.
+
+Each probe is a module-level function behind a TTL cache, so screens
+that show the same value (SSID and IP on both the identity and network
+screens) share one lookup instead of each forking its own subprocess.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+import socket
+import struct
+import subprocess
+import threading
+import time
+from typing import Callable, TypeVar
+
+from ._net_ioctl import get_ipv4
+
+T = TypeVar("T")
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+FREQ_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
+GOVERNOR_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+# Exposed by the raspberrypi firmware driver; prints the same bitmask
+# as `vcgencmd get_throttled`, in hex without the 0x prefix
+THROTTLED_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+
+# Fallback for the values above plus voltage, which has no sysfs node;
+# one shell keeps it to a single spawn from Python per refresh
+_VCGENCMD_BATCH = (
+    "vcgencmd measure_temp; vcgencmd measure_volts; vcgencmd get_throttled"
+)
+
+MAC_PATH = "/sys/class/net/wlan0/address"
+RESOLV_CONF = "/etc/resolv.conf"
+_NAMESERVER_RE = re.compile(rb"^nameserver\s+(\S+)", re.M)
+
+# One line per socket after a header; counting them avoids the
+# /proc/*/fd walk psutil.net_connections() does to map sockets to PIDs
+_PROC_NET_INET = (
+    "/proc/net/tcp",
+    "/proc/net/tcp6",
+    "/proc/net/udp",
+    "/proc/net/udp6",
+)
+
+
+def ttl_cached(
+    ttl: float, max_ttl: float | None = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Cache a function's result per argument tuple for ttl seconds.
+
+    For slow-changing telemetry (subprocess probes, config files) that
+    would otherwise be re-read on every render. Calls are serialized per
+    function so concurrent probes share one refresh instead of each running it.
+
+    With max_ttl, each refresh that returns an unchanged value doubles the
+    TTL up to max_ttl, and any change drops it back to ttl.
+    """
+    cap = ttl if max_ttl is None else max_ttl
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # args -> (value, expiry, current ttl)
+        cache: dict[tuple, tuple[T, float, float]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: object) -> T:
+            with lock:
+                hit = cache.get(args)
+                if hit is not None and time.monotonic() < hit[1]:
+                    return hit[0]
+                value = func(*args)
+                if hit is not None and hit[0] == value:
+                    cur = min(hit[2] * 2, cap)
+                else:
+                    cur = ttl
+                cache[args] = (value, time.monotonic() + cur, cur)
+                return value
+
+        return wrapper
+
+    return decorator
+
+
+def read_sysfs(path: str) -> bytes:
+    """Read a small sysfs attribute without text-mode file machinery.
+
+    int() accepts the bytes directly, trailing newline included.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 64)
+    finally:
+        os.close(fd)
+
+
+# --- Host ---
+
+
+@ttl_cached(60.0)
+def get_hostname() -> str:
+    return socket.gethostname()
+
+
+# --- CPU / firmware ---
+
+
+@ttl_cached(2.0)
+def _read_vcgencmd() -> dict[str, str]:
+    """Run every vcgencmd query from one shell; return {key: value}.
+
+    Output lines look like ``temp=48.3'C``, so they are keyed by the
+    text before ``=``.
+    """
+    try:
+        out = subprocess.run(
+            ["sh", "-c", _VCGENCMD_BATCH],
+            capture_output=True, text=True, timeout=2,
+        ).stdout
+    except (subprocess.SubprocessError, OSError):
+        return {}
+    values = {}
+    for line in out.splitlines():
+        key, sep, value = line.strip().partition("=")
+        if sep:
+            values[key] = value
+    return values
+
+
+@ttl_cached(2.0, max_ttl=30.0)
+def get_temp() -> float:
+    """Return SoC temperature in degrees Celsius, or 0.0."""
+    try:
+        return int(read_sysfs(THERMAL_PATH)) / 1000.0
+    except (OSError, ValueError):
+        pass
+    raw = _read_vcgencmd().get("temp", "")
+    try:
+        return float(raw.replace("'C", ""))
+    except ValueError:
+        return 0.0
+
+
+@ttl_cached(10.0, max_ttl=60.0)
+def get_voltage() -> str:
+    return _read_vcgencmd().get("volt", "N/A")
+
+
+def get_freq() -> int:
+    """Return CPU frequency in MHz."""
+    try:
+        return int(read_sysfs(FREQ_PATH)) // 1000
+    except (OSError, ValueError):
+        return 0
+
+
+@ttl_cached(10.0, max_ttl=60.0)
+def get_governor() -> str:
+    try:
+        return read_sysfs(GOVERNOR_PATH).strip().decode()
+    except OSError:
+        return "N/A"
+
+
+@ttl_cached(2.0, max_ttl=60.0)
+def get_throttled() -> int:
+    """Return the get_throttled bitmask, or -1 if unavailable."""
+    try:
+        return int(read_sysfs(THROTTLED_PATH), 16)
+    except (OSError, ValueError):
+        pass
+    raw = _read_vcgencmd().get("throttled", "")
+    try:
+        return int(raw, 16)
+    except ValueError:
+        return -1
+
+
+# --- Network ---
+
+
+@ttl_cached(2.0, max_ttl=60.0)
+def get_ip() -> str:
+    for iface in ("wlan0", "eth0"):
+        addr = get_ipv4(iface)
+        if addr is not None:
+            return addr
+    return "No IP"
+
+
+@functools.lru_cache(maxsize=1)
+def _read_mac() -> str:
+    return read_sysfs(MAC_PATH).strip().decode()
+
+
+def get_mac() -> str:
+    """Return the wlan0 MAC address.
+
+    The address never changes, so a successful read is cached for good;
+    lru_cache does not cache exceptions, so a missing interface (driver
+    not loaded yet) is retried on the next call.
+    """
+    try:
+        return _read_mac()
+    except OSError:
+        return "N/A"
+
+
+@ttl_cached(60.0)
+def get_ssid() -> str:
+    try:
+        return (
+            subprocess.check_output(
+                ["/usr/sbin/iwgetid", "-r"], text=True, timeout=2
+            ).strip()
+            or "N/A"
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return "N/A"
+
+
+@ttl_cached(10.0)
+def get_signal() -> str:
+    """Return wlan0 signal level from /proc/net/wireless, e.g. "-52 dBm"."""
+    try:
+        with open("/proc/net/wireless") as f:
+            for line in f:
+                # "wlan0: status link level noise ..."; level is in dBm
+                cols = line.split()
+                if cols and cols[0] == "wlan0:":
+                    return f"{int(float(cols[3]))} dBm"
+    except (OSError, IndexError, ValueError):
+        pass
+    return "N/A"
+
+
+@ttl_cached(60.0)
+def get_frequency() -> str:
+    """Return the WiFi channel frequency, e.g. "2437 MHz".
+
+    Not exposed in /proc or sysfs, so this still asks `iw`; the channel
+    only changes on a roam, hence the long TTL.
+    """
+    try:
+        out = subprocess.check_output(
+            ["iw", "dev", "wlan0", "link"],
+            text=True,
+            timeout=2,
+            stderr=subprocess.DEVNULL,
+        )
+        for line in out.splitlines():
+            line = line.strip()
+            if line.startswith("freq:"):
+                return line.split("freq:")[1].strip() + " MHz"
+    except (subprocess.SubprocessError, FileNotFoundError):
+        pass
+    return "N/A"
+
+
+@ttl_cached(10.0, max_ttl=60.0)
+def get_gateway() -> str:
+    """Return the IPv4 default gateway from the kernel routing table."""
+    try:
+        with open("/proc/net/route") as f:
+            next(f)  # header
+            for line in f:
+                # Iface Destination Gateway Flags ...; addresses are
+                # little-endian hex
+                fields = line.split()
+                if len(fields) > 2 and fields[1] == "00000000":
+                    return socket.inet_ntoa(struct.pack("<I", int(fields[2], 16)))
+    except (OSError, StopIteration, ValueError):
+        pass
+    return "N/A"
+
+
+@ttl_cached(10.0, max_ttl=60.0)
+def get_dns() -> str:
+    try:
+        with open(RESOLV_CONF, "rb") as f:
+            m = _NAMESERVER_RE.search(f.read())
+    except OSError:
+        return "N/A"
+    return m.group(1).decode() if m else "N/A"
+
+
+@ttl_cached(5.0)
+def get_connections() -> int:
+    """Count inet sockets (same set as psutil kind="inet")."""
+    total = 0
+    for path in _PROC_NET_INET:
+        try:
+            with open(path) as f:
+                total += sum(1 for _ in f) - 1  # minus header line
+        except OSError:
+            # e.g. no tcp6/udp6 when IPv6 is disabled
+            continue
+    return total
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import gzip
 import hashlib
+import http.client
+import io
 import json
 import logging
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from PIL import Image
 
@@ -41,14 +48,100 @@ def _load_access_key() -> str:
     )
 
 
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+# Keep-alive connections, one per (scheme, host) per thread, so repeated
+# downloads from the same CDN reuse a single TCP+TLS session.
+_http_local = threading.local()
+
+
+def _connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    """Return this thread's pooled connection to scheme://host."""
+    pool = _http_local.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, host))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, timeout=30)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=30)
+        pool[(scheme, host)] = conn
+    return conn
+
+
+def _drop_connection(scheme: str, host: str) -> None:
+    conn = _http_local.__dict__.get("pool", {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+
+def _urlopen_get(url: str, hdrs: dict[str, str]) -> bytes:
+    """Fetch URL through urllib, which applies the *_proxy env variables."""
+    with urlopen(Request(url, headers=hdrs), timeout=30) as resp:
+        body = resp.read()
+        if resp.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+
 def _http_get(url: str, headers: dict[str, str] | None = None) -> bytes:
-    """Fetch URL content."""
-    hdrs = {"User-Agent": _USER_AGENT}
+    """Fetch URL content over a reused keep-alive connection.
+
+    Hosts that go through an http_proxy/https_proxy are fetched with
+    urlopen() instead, without connection reuse.
+    """
+    hdrs = {"User-Agent": _USER_AGENT, "Accept-Encoding": "gzip"}
     if headers:
         hdrs.update(headers)
-    req = Request(url, headers=hdrs)
-    with urlopen(req, timeout=30) as resp:
-        return resp.read()
+    proxies = getproxies()
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if parts.scheme in proxies and not proxy_bypass(parts.hostname or ""):
+            return _urlopen_get(url, hdrs)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        # A reused connection may have been closed by the server while
+        # idle, which only shows once we write to it or read the reply;
+        # retry that once on a fresh one. Timeouts and failures on a new
+        # connection are real and raise.
+        for _attempt in range(2):
+            conn = _connection(parts.scheme, parts.netloc)
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", target, headers=hdrs)
+            except OSError as e:
+                _drop_connection(parts.scheme, parts.netloc)
+                if reused and not isinstance(e, TimeoutError):
+                    continue
+                raise
+            try:
+                resp = conn.getresponse()
+                body = resp.read()
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                _drop_connection(parts.scheme, parts.netloc)
+                if reused:
+                    continue
+                raise
+            except (http.client.HTTPException, OSError):
+                _drop_connection(parts.scheme, parts.netloc)
+                raise
+            break
+
+        if resp.status in _REDIRECT_CODES and resp.getheader("Location"):
+            url = urljoin(url, resp.getheader("Location"))
+            continue
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        if resp.getheader("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    raise HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
 
 
 def _cover_crop(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
@@ -71,6 +164,16 @@ def _cover_crop(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
     return img.crop((left, top, left + target_w, top + target_h))
 
 
+@functools.lru_cache(maxsize=MAX_CACHED)
+def _load_layers(h: str) -> tuple[Image.Image, Image.Image]:
+    """Open and fully decode the cached (black, red) PNG layers for a hash."""
+    black = Image.open(CACHE_DIR / f"{h}_black.png")
+    red = Image.open(CACHE_DIR / f"{h}_red.png")
+    black.load()
+    red.load()
+    return black, red
+
+
 class PhotoCache:
     """Manage downloaded and pre-dithered Unsplash photos."""
 
@@ -78,6 +181,8 @@ class PhotoCache:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self._meta_path = CACHE_DIR / "meta.json"
         self._meta: dict = self._load_meta()
+        self._sweep_orphans()
+        self._dirty = False  # in-memory meta has changes not yet on disk
         self._index = 0
         self._lock = threading.Lock()
         self._bg_thread: threading.Thread | None = None
@@ -91,42 +196,80 @@ class PhotoCache:
                 pass
         return {"photos": []}
 
+    def _sweep_orphans(self) -> None:
+        """Delete cache files no metadata entry refers to.
+
+        Layers are left behind when the process dies after saving a
+        photo's layers but before the batch's metadata was flushed.
+        Downloaded JPGs are no longer written at all, so any left by
+        older versions are removed too.
+        """
+        known = {p["hash"] for p in self._meta["photos"]}
+        for path in CACHE_DIR.glob("*.png"):
+            if path.name.rsplit("_", 1)[0] not in known:
+                path.unlink(missing_ok=True)
+                log.info("Removed orphaned layer file: %s", path.name)
+        for path in CACHE_DIR.glob("*.jpg"):
+            path.unlink(missing_ok=True)
+            log.info("Removed legacy download: %s", path.name)
+
     def _save_meta(self) -> None:
         self._meta_path.write_text(json.dumps(self._meta, indent=2))
 
+    def _flush_meta(self) -> None:
+        """Write metadata once after a batch if any photo changed it."""
+        with self._lock:
+            if self._dirty:
+                self._save_meta()
+                self._dirty = False
+
+    def _count_nolock(self) -> int:
+        """Number of cached photos. Caller must hold _lock."""
+        return len(self._meta["photos"])
+
     @property
     def count(self) -> int:
         with self._lock:
-            return len(self._meta["photos"])
+            return self._count_nolock()
 
     @property
     def index(self) -> int:
         return self._index
 
     def advance(self) -> None:
-        c = self.count
-        if c > 0:
-            self._index = (self._index + 1) % c
+        with self._lock:
+            c = self._count_nolock()
+            if c > 0:
+                self._index = (self._index + 1) % c
 
     def retreat(self) -> None:
-        c = self.count
-        if c > 0:
-            self._index = (self._index - 1) % c
+        with self._lock:
+            c = self._count_nolock()
+            if c > 0:
+                self._index = (self._index - 1) % c
 
     def _hash_url(self, url: str) -> str:
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
 
     def _known_ids(self) -> set[str]:
         return {p["id"] for p in self._meta["photos"]}
 
-    def _evict_oldest(self) -> None:
-        """Remove oldest entries beyond MAX_CACHED. Caller must hold _lock."""
+    def _evict_oldest(self) -> bool:
+        """Remove oldest entries beyond MAX_CACHED. Caller must hold _lock.
+
+        Return True if any entry (and its layer files) was removed.
+        """
+        evicted = False
         while len(self._meta["photos"]) > MAX_CACHED:
             old = self._meta["photos"].pop(0)
             h = old["hash"]
-            for suffix in (".jpg", "_black.png", "_red.png"):
+            for suffix in ("_black.png", "_red.png"):
                 (CACHE_DIR / f"{h}{suffix}").unlink(missing_ok=True)
             log.info("Evicted cached photo: %s", old.get("id", h))
+            evicted = True
+        if evicted:
+            _load_layers.cache_clear()
+        return evicted
 
     def _fetch_photo_list(self) -> list[dict]:
         """Fetch random landscape photos from Unsplash API."""
@@ -152,19 +295,25 @@ class PhotoCache:
         log.info("Got %d photos from Unsplash.", len(result))
         return result
 
-    def _process_one(self, photo: dict) -> bool:
-        """Download, crop, dither, and cache a single photo. Return True on success."""
+    def _download(self, photo: dict) -> bytes | None:
+        """Fetch a photo's image bytes. Return None on failure."""
+        try:
+            log.info("Downloading: %s", photo["desc"][:60] or photo["id"])
+            return _http_get(photo["url"])
+        except Exception:
+            log.warning(
+                "Failed to download photo: %s", photo["id"], exc_info=True
+            )
+            return None
+
+    def _cache_photo(self, photo: dict, data: bytes) -> bool:
+        """Crop, dither, and cache downloaded image bytes. Return True on success."""
         h = self._hash_url(photo["url"])
-        jpg_path = CACHE_DIR / f"{h}.jpg"
         black_path = CACHE_DIR / f"{h}_black.png"
         red_path = CACHE_DIR / f"{h}_red.png"
 
         try:
-            log.info("Downloading: %s", photo["desc"][:60] or photo["id"])
-            data = _http_get(photo["url"])
-            jpg_path.write_bytes(data)
-
-            img = Image.open(jpg_path).convert("RGB")
+            img = Image.open(io.BytesIO(data)).convert("RGB")
             img = _cover_crop(img, WIDTH, HEIGHT)
 
             black_layer, red_layer = dither_image(img)
@@ -175,8 +324,13 @@ class PhotoCache:
                 self._meta["photos"].append(
                     {"id": photo["id"], "url": photo["url"], "hash": h}
                 )
-                self._evict_oldest()
-                self._save_meta()
+                if self._evict_oldest():
+                    # Files are already gone; don't leave meta.json
+                    # pointing at them until the batch ends
+                    self._save_meta()
+                    self._dirty = False
+                else:
+                    self._dirty = True
 
             log.info("Cached photo: %s (%s)", photo["id"], h)
             return True
@@ -185,10 +339,15 @@ class PhotoCache:
             log.warning(
                 "Failed to process photo: %s", photo["id"], exc_info=True
             )
-            for p in (jpg_path, black_path, red_path):
+            for p in (black_path, red_path):
                 p.unlink(missing_ok=True)
             return False
 
+    def _process_one(self, photo: dict) -> bool:
+        """Download, crop, dither, and cache a single photo. Return True on success."""
+        data = self._download(photo)
+        return data is not None and self._cache_photo(photo, data)
+
     def refresh_first(self) -> bool:
         """Fetch photo list, process first new one, queue the rest.
 
@@ -209,6 +368,7 @@ class PhotoCache:
         self._pending = new_photos[1:]
 
         ok = self._process_one(first)
+        self._flush_meta()
         log.info(
             "First photo %s, %d remaining in queue.",
             "ready" if ok else "failed",
@@ -225,8 +385,16 @@ class PhotoCache:
         self._pending = []
 
         def _worker() -> None:
-            for photo in remaining:
-                self._process_one(photo)
+            # Download on this thread, one after another, so every photo
+            # reuses this thread's keep-alive connection. Dithering holds
+            # the GIL, so a single dither thread is all that overlaps
+            # usefully with the next download.
+            with ThreadPoolExecutor(max_workers=1) as dither_pool:
+                for photo in remaining:
+                    data = self._download(photo)
+                    if data is not None:
+                        dither_pool.submit(self._cache_photo, photo, data)
+            self._flush_meta()
             log.info("Background refresh complete, %d total cached.", self.count)
 
         self._bg_thread = threading.Thread(target=_worker, daemon=True)
@@ -244,6 +412,7 @@ class PhotoCache:
                 continue
             if self._process_one(photo):
                 new_count += 1
+        self._flush_meta()
 
         log.info(
             "Photo cache refresh: %d new, %d total.", new_count, self.count
@@ -275,4 +444,4 @@ class PhotoCache:
                 self._save_meta()
             return None
 
-        return Image.open(black_path), Image.open(red_path)
+        return _load_layers(h)
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import random
 
+import numpy as np
+
 from ..composer import Composer, WIDTH, HEIGHT
-from .base import BaseScreen
+from .base import BaseScreen, mask_image
 
 
 class ArtScreen(BaseScreen):
@@ -37,51 +39,36 @@ class ArtScreen(BaseScreen):
         # For each pixel, find nearest seed and assign its color
         # Use a coarser grid for performance (4x4 blocks)
         block = 4
-        for by in range(0, HEIGHT, block):
-            for bx in range(0, WIDTH, block):
-                cx, cy = bx + block // 2, by + block // 2
-                best_dist = float("inf")
-                best_idx = 0
-                for i, (sx, sy) in enumerate(seeds):
-                    dist = (cx - sx) ** 2 + (cy - sy) ** 2
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_idx = i
-
-                c = colors[best_idx]
-                if c != "white":
-                    composer.rect(
-                        (
-                            bx,
-                            by,
-                            min(bx + block, WIDTH) - 1,
-                            min(by + block, HEIGHT) - 1,
-                        ),
-                        color=c,
-                    )
-
-        # Draw cell borders by finding pixels where nearest seed changes
-        for by in range(0, HEIGHT, block):
-            for bx in range(0, WIDTH - block, block):
-                cx1, cy1 = bx + block // 2, by + block // 2
-                cx2 = cx1 + block
-
-                best1 = min(
-                    range(n_points),
-                    key=lambda i: (cx1 - seeds[i][0]) ** 2
-                    + (cy1 - seeds[i][1]) ** 2,
-                )
-                best2 = min(
-                    range(n_points),
-                    key=lambda i: (cx2 - seeds[i][0]) ** 2
-                    + (cy1 - seeds[i][1]) ** 2,
-                )
-
-                if best1 != best2:
-                    composer.line(
-                        (bx + block, by, bx + block, min(by + block, HEIGHT) - 1),
-                        color="black",
-                    )
+        cx = np.arange(0, WIDTH, block, dtype=np.int32) + block // 2
+        cy = np.arange(0, HEIGHT, block, dtype=np.int32)[:, None] + block // 2
+
+        # Running minimum over seeds keeps memory at one (rows, cols) grid;
+        # strict < keeps the lowest seed index on ties, like argmin
+        best = np.full((cy.size, cx.size), np.iinfo(np.int32).max, dtype=np.int32)
+        nearest = np.zeros(best.shape, dtype=np.intp)
+        for i, (sx, sy) in enumerate(seeds):
+            dx = cx - sx
+            dy = cy - sy
+            dist = dx * dx + dy * dy
+            closer = dist < best
+            best[closer] = dist[closer]
+            nearest[closer] = i
+
+        # Expand block colors to pixel masks and ink each layer in one pass
+        cell_colors = np.array(colors)[nearest]
+        pixels = np.repeat(np.repeat(cell_colors, block, 0), block, 1)
+        pixels = pixels[:HEIGHT, :WIDTH]
+        black_mask = pixels == "black"
+        red_mask = pixels == "red"
+
+        # Cell borders where the nearest seed changes between
+        # horizontally adjacent blocks
+        border = np.zeros_like(nearest, dtype=bool)
+        border[:, 1:] = nearest[:, :-1] != nearest[:, 1:]
+        black_mask[:, ::block] |= np.repeat(border, block, 0)[:HEIGHT]
+
+        composer.paste_mask(mask_image(black_mask), color="black")
+        composer.paste_mask(mask_image(red_mask), color="red")
 
     def _concentric_geometry(self, composer: Composer) -> None:
         """Generate concentric geometric shapes."""
@@ -122,29 +109,28 @@ class ArtScreen(BaseScreen):
         color: str,
         fill: bool,
     ) -> None:
-        """Draw a diamond shape as 4 lines."""
-        composer.line((cx, cy - r, cx + r, cy), color=color)
-        composer.line((cx + r, cy, cx, cy + r), color=color)
-        composer.line((cx, cy + r, cx - r, cy), color=color)
-        composer.line((cx - r, cy, cx, cy - r), color=color)
-
-        if fill:
-            for dy in range(-r + 1, r):
-                half_w = r - abs(dy)
-                if half_w > 0:
-                    composer.line(
-                        (cx - half_w, cy + dy, cx + half_w, cy + dy),
-                        color=color,
-                    )
+        """Draw a diamond shape as a single polygon."""
+        composer.polygon(
+            [(cx, cy - r), (cx + r, cy), (cx, cy + r), (cx - r, cy)],
+            color=color,
+            fill=fill,
+        )
 
     def _tile_grid(self, composer: Composer) -> None:
         """Generate a random tile grid pattern."""
         tile_size = random.choice([16, 22, 32])
-        cols = WIDTH // tile_size + 1
-        rows = HEIGHT // tile_size + 1
+        cols = -(-WIDTH // tile_size)
+        rows = -(-HEIGHT // tile_size)
 
         patterns = ["solid", "cross", "diagonal", "dots", "empty"]
 
+        # Solid tiles are collected into one mask per layer and inked at
+        # the end; strokes are additive, so draw order does not matter
+        solids = {
+            "black": np.zeros((HEIGHT, WIDTH), dtype=bool),
+            "red": np.zeros((HEIGHT, WIDTH), dtype=bool),
+        }
+
         for row in range(rows):
             for col in range(cols):
                 x = col * tile_size
@@ -156,7 +142,7 @@ class ArtScreen(BaseScreen):
                 color = random.choice(["black", "red"])
 
                 if pattern == "solid":
-                    composer.rect((x, y, x1, y1), color=color)
+                    solids[color][y:y1 + 1, x:x1 + 1] = True
                 elif pattern == "cross":
                     mid_x = x + tile_size // 2
                     mid_y = y + tile_size // 2
@@ -174,3 +160,7 @@ class ArtScreen(BaseScreen):
                         color=color,
                     )
                 # "empty" = white, nothing to draw
+
+        for color, mask in solids.items():
+            if mask.any():
+                composer.paste_mask(mask_image(mask), color=color)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from PIL import ImageFont
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 
 from ..composer import Composer, WIDTH, HEIGHT
 
@@ -10,6 +14,7 @@ FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
 FONT_BOLD_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 
 
+@functools.lru_cache(maxsize=None)
 def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     path = FONT_BOLD_PATH if bold else FONT_PATH
     try:
@@ -18,14 +23,27 @@ def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
         return ImageFont.load_default()
 
 
-# Font definitions
-FONT_HERO = _load_font(40, bold=True)
-FONT_LARGE = _load_font(24, bold=True)
-FONT_TITLE = _load_font(18, bold=True)
-FONT_SECTION = _load_font(14, bold=True)
-FONT_BODY = _load_font(14)
-FONT_LABEL = _load_font(13, bold=True)
-FONT_SMALL = _load_font(12, bold=True)
+# Font definitions: (size, bold), loaded on first access via __getattr__
+_FONTS = {
+    "FONT_HERO": (40, True),
+    "FONT_LARGE": (24, True),
+    "FONT_TITLE": (18, True),
+    "FONT_SECTION": (14, True),
+    "FONT_BODY": (14, False),
+    "FONT_LABEL": (13, True),
+    "FONT_SMALL": (12, True),
+}
+
+
+def _font(name: str) -> ImageFont.FreeTypeFont:
+    return _load_font(*_FONTS[name])
+
+
+def __getattr__(name: str) -> ImageFont.FreeTypeFont:
+    if name not in _FONTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _font(name)
+
 
 # Layout constants
 HEADER_HEIGHT = 22
@@ -34,6 +52,45 @@ CONTENT_TOP = HEADER_HEIGHT + 2
 CONTENT_BOTTOM = HEIGHT - FOOTER_HEIGHT - 2
 MARGIN = 4
 
+# Worker threads for running blocking probes (subprocesses, sysfs) at once
+PROBE_WORKERS = 4
+
+# Footer navigation dots
+DOT_R = 2
+DOT_SPACING = 12
+DOT_START_X = 4
+
+
+@functools.lru_cache(maxsize=None)
+def probe_pool() -> ThreadPoolExecutor:
+    """Shared pool for screens that collect several blocking probes per draw.
+
+    Created on first use so screens that never need it do not start threads.
+    """
+    return ThreadPoolExecutor(
+        max_workers=PROBE_WORKERS, thread_name_prefix="probe"
+    )
+
+
+def mask_image(mask: np.ndarray) -> Image.Image:
+    """Convert a boolean array into an "L" ink mask for Composer.paste_mask."""
+    return Image.fromarray(mask.astype(np.uint8) * 255, "L")
+
+
+@functools.lru_cache(maxsize=32)
+def _dot_strip(total: int, current: int) -> Image.Image:
+    """Render the footer dots once per (total, current) as an ink mask."""
+    d = DOT_R * 2
+    strip = Image.new("L", (max(1, (total - 1) * DOT_SPACING + d + 1), d + 1), 0)
+    draw = ImageDraw.Draw(strip)
+    for i in range(total):
+        x = i * DOT_SPACING
+        if i == current:
+            draw.ellipse([(x, 0), (x + d, d)], fill=255)
+        else:
+            draw.ellipse([(x, 0), (x + d, d)], outline=255)
+    return strip
+
 
 class BaseScreen:
     """Base class for e-paper dashboard screens."""
@@ -55,7 +112,7 @@ class BaseScreen:
         # Red header banner
         composer.rect((0, 0, WIDTH, HEADER_HEIGHT), color="red")
         # Title text in black on the red banner — creates black text on red bg
-        composer.text_centered(3, self.title, FONT_TITLE, color="black")
+        composer.text_centered(3, self.title, _font("FONT_TITLE"), color="black")
 
         # Draw screen content
         self.draw(composer)
@@ -79,24 +136,10 @@ class BaseScreen:
         y = HEIGHT - FOOTER_HEIGHT + 2
 
         # Screen indicator dots
-        dot_r = 2
-        spacing = 12
-        start_x = 4
-
-        for i in range(total):
-            cx = start_x + i * spacing + dot_r
-            if i == current:
-                composer.ellipse(
-                    (cx - dot_r, y - dot_r, cx + dot_r, y + dot_r),
-                    color="black",
-                )
-            else:
-                composer.ellipse(
-                    (cx - dot_r, y - dot_r, cx + dot_r, y + dot_r),
-                    color="black",
-                    fill=False,
-                )
+        composer.paste_mask(
+            _dot_strip(total, current), (DOT_START_X, y - DOT_R), color="black"
+        )
 
         # Timestamp
         ts = time.strftime("Updated %H:%M")
-        composer.text_right(y - 2, ts, FONT_SMALL, color="black")
+        composer.text_right(y - 2, ts, _font("FONT_SMALL"), color="black")
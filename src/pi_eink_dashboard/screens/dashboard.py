@@ -1,11 +1,12 @@
 """Screen 1: System overview dashboard with hero temperature and progress bars."""
 
 import os
-import socket
-import subprocess
+import time
+from dataclasses import dataclass
 
 import psutil
 
+from .. import metrics
 from ..composer import Composer, WIDTH
 from .base import (
     BaseScreen,
@@ -17,18 +18,48 @@ from .base import (
     MARGIN,
 )
 
+STATS_INTERVAL = 30.0  # seconds a stats snapshot is reused across redraws
+
+
+@dataclass(frozen=True)
+class SystemStats:
+    """Snapshot of the values shown on the dashboard."""
+
+    temp: float
+    cpu: float
+    mem: float
+    disk: float
+    load: tuple[float, float, float]
+    procs: int
+
+
+def _sample() -> SystemStats:
+    return SystemStats(
+        temp=metrics.get_temp(),
+        cpu=psutil.cpu_percent(interval=0),
+        mem=psutil.virtual_memory().percent,
+        disk=psutil.disk_usage("/").percent,
+        load=os.getloadavg(),
+        procs=len(psutil.pids()),
+    )
+
 
 class DashboardScreen(BaseScreen):
     title = "DASHBOARD"
 
-    def _get_temp(self) -> float:
-        try:
-            raw = subprocess.check_output(
-                ["vcgencmd", "measure_temp"], text=True, timeout=2
-            ).strip()
-            return float(raw.split("=")[1].replace("'C", ""))
-        except (subprocess.SubprocessError, FileNotFoundError, IndexError, ValueError):
-            return 0.0
+    def __init__(self) -> None:
+        self._latest: tuple[float, SystemStats] | None = None
+
+    def _stats(self) -> SystemStats:
+        """Return the stats snapshot, re-probing it once it is STATS_INTERVAL old.
+
+        Quick redraws (button presses) reuse the snapshot, while every
+        auto-refresh samples afresh, so the values match the footer time.
+        """
+        now = time.monotonic()
+        if self._latest is None or now - self._latest[0] > STATS_INTERVAL:
+            self._latest = (now, _sample())
+        return self._latest[1]
 
     def _get_uptime(self) -> str:
         try:
@@ -45,16 +76,16 @@ class DashboardScreen(BaseScreen):
 
     def draw(self, composer: Composer) -> None:
         y = CONTENT_TOP + 2
+        stats = self._stats()
 
         # Hostname and uptime on the same line
-        hostname = socket.gethostname()
         uptime = self._get_uptime()
-        composer.text((MARGIN, y), hostname, FONT_BODY, color="black")
+        composer.text((MARGIN, y), metrics.get_hostname(), FONT_BODY, color="black")
         composer.text_right(y, uptime, FONT_SMALL, color="black")
         y += 18
 
         # Hero temperature with decorative frame
-        temp = self._get_temp()
+        temp = stats.temp
         temp_str = f"{temp:.1f}\u00b0C"
         color = "red" if temp >= 70 else "black"
 
@@ -73,28 +104,24 @@ class DashboardScreen(BaseScreen):
         y += frame_h + 8
 
         # CPU / RAM / DISK progress bars with red labels
-        cpu_pct = psutil.cpu_percent(interval=0)
-        self._draw_labeled_bar(composer, y, "CPU", cpu_pct)
+        self._draw_labeled_bar(composer, y, "CPU", stats.cpu)
         y += 18
 
-        mem = psutil.virtual_memory()
-        self._draw_labeled_bar(composer, y, "RAM", mem.percent)
+        self._draw_labeled_bar(composer, y, "RAM", stats.mem)
         y += 18
 
-        disk = psutil.disk_usage("/")
-        self._draw_labeled_bar(composer, y, "DISK", disk.percent)
+        self._draw_labeled_bar(composer, y, "DISK", stats.disk)
         y += 20
 
         # Load average and process count in footer area
-        load1, load5, load15 = os.getloadavg()
+        load1, load5, load15 = stats.load
         composer.text(
             (MARGIN, y),
             f"Load: {load1:.2f} {load5:.2f} {load15:.2f}",
             FONT_SMALL,
             color="black",
         )
-        procs = len(psutil.pids())
-        composer.text_right(y, f"Procs: {procs}", FONT_SMALL, color="black")
+        composer.text_right(y, f"Procs: {stats.procs}", FONT_SMALL, color="black")
 
     def _draw_labeled_bar(
         self,
@@ -7,15 +7,31 @@ Validates display hardware and dithering quality with:
 - Text rendering at multiple sizes in both colors
 """
 
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image
+
 from ..composer import Composer, WIDTH
-from .base import BaseScreen, FONT_LARGE, FONT_BODY, FONT_SMALL
+from .base import BaseScreen, FONT_LARGE, FONT_BODY, FONT_SMALL, mask_image
 
 
 class TestPatternScreen(BaseScreen):
     title = ""
     fullbleed = True
 
+    def __init__(self) -> None:
+        self._cached: tuple[Image.Image, Image.Image] | None = None
+
     def draw(self, composer: Composer) -> None:
+        # The pattern has no runtime inputs: render it once, then blit
+        if self._cached is None:
+            scratch = Composer()
+            self._draw_pattern(scratch)
+            self._cached = scratch.result()
+        composer.paste_image(*self._cached)
+
+    def _draw_pattern(self, composer: Composer) -> None:
         y = 0
 
         # === Section 1: Solid color blocks ===
@@ -31,8 +47,7 @@ class TestPatternScreen(BaseScreen):
         # Labels (drawn in opposite color for visibility)
         composer.text_centered(y + 8, "BLACK          WHITE            RED", FONT_SMALL, color="red")
         # Overwrite middle label in black
-        mid_x = (WIDTH - composer.textlength("WHITE", FONT_SMALL)) // 2
-        composer.text((mid_x, y + 8), "WHITE", FONT_SMALL, color="black")
+        composer.text_centered(y + 8, "WHITE", FONT_SMALL, color="black")
         y += block_h + 2
 
         # === Section 2: Dithered gradients ===
@@ -100,35 +115,34 @@ class TestPatternScreen(BaseScreen):
         steps = 8
         step_w = width // steps
 
+        # Build the whole strip as one mask, a step at a time
+        mask = np.zeros((height, steps * step_w), dtype=bool)
+        rel_x = np.arange(step_w)
+        rel_y = np.arange(height)[:, None]
+
         for i in range(steps):
             sx = x + i * step_w
+            cell = mask[:, i * step_w:(i + 1) * step_w]
             density = 1.0 - (i / (steps - 1))  # 1.0 = solid, 0.0 = empty
 
             if density >= 0.9:
-                composer.rect((sx, y, sx + step_w - 1, y + height - 1), color=color)
+                cell[:] = True
             elif density >= 0.7:
                 # Dense checkerboard
-                for py in range(y, y + height):
-                    for px in range(sx, sx + step_w):
-                        if (px + py) % 2 == 0:
-                            composer.rect((px, py, px, py), color=color)
+                cell[:] = (sx + rel_x + y + rel_y) % 2 == 0
             elif density >= 0.5:
                 # Medium checkerboard (every other pixel in every other row)
-                for py in range(y, y + height, 2):
-                    for px in range(sx, sx + step_w, 2):
-                        composer.rect((px, py, px, py), color=color)
+                cell[:] = (rel_y % 2 == 0) & (rel_x % 2 == 0)
             elif density >= 0.3:
                 # Sparse dots
-                for py in range(y, y + height, 3):
-                    for px in range(sx, sx + step_w, 3):
-                        composer.rect((px, py, px, py), color=color)
+                cell[:] = (rel_y % 3 == 0) & (rel_x % 3 == 0)
             elif density >= 0.1:
                 # Very sparse dots
-                for py in range(y, y + height, 4):
-                    for px in range(sx, sx + step_w, 4):
-                        composer.rect((px, py, px, py), color=color)
+                cell[:] = (rel_y % 4 == 0) & (rel_x % 4 == 0)
             # density < 0.1: leave white
 
+        composer.paste_mask(mask_image(mask), (x, y), color=color)
+
     def _draw_mixed_gradient(
         self,
         composer: Composer,
@@ -140,18 +154,17 @@ class TestPatternScreen(BaseScreen):
         """Draw a gradient from black to red using alternating pixels."""
         steps = 8
         step_w = width // steps
+        strip_w = steps * step_w
 
-        for i in range(steps):
-            sx = x + i * step_w
-            # 0 = all black, 7 = all red
-            red_ratio = i / (steps - 1)
-
-            for py in range(y, y + height):
-                for px in range(sx, sx + step_w):
-                    # Use position hash to determine color
-                    pixel_hash = (px * 7 + py * 13) % steps
-                    threshold = int(red_ratio * steps)
-                    if pixel_hash < threshold:
-                        composer.rect((px, py, px, py), color="red")
-                    else:
-                        composer.rect((px, py, px, py), color="black")
+        # Position hash per pixel; each step turns red below its threshold
+        xs = np.arange(x, x + strip_w)
+        ys = np.arange(y, y + height)[:, None]
+        pixel_hash = (xs * 7 + ys * 13) % steps
+
+        # 0 = all black, 7 = all red
+        red_ratio = np.arange(steps) / (steps - 1)
+        threshold = np.repeat((red_ratio * steps).astype(int), step_w)
+        red = pixel_hash < threshold
+
+        composer.paste_mask(mask_image(red), (x, y), color="red")
+        composer.paste_mask(mask_image(~red), (x, y), color="black")